@@ -1,8 +1,11 @@
+import ast
+import os
+
 extensions = [
+    'autoapi.extension',
     'sphinx.ext.autodoc',
     'sphinx.ext.viewcode',
     'sphinx.ext.napoleon',
-    'sphinx_autodoc_typehints',
     ]
 
 templates_path = ['_templates']
@@ -12,12 +15,25 @@ project = 'eventkit'
 copyright = '2021, Ewald de Wit'
 author = 'Ewald de Wit'
 
-__version__ = None
-exec(open('../eventkit/version.py').read())
+
+def _read_version():
+    path = os.path.join(os.path.dirname(__file__), '../eventkit/version.py')
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                getattr(t, 'id', None) == '__version_info__'
+                for t in node.targets):
+            version_info = ast.literal_eval(node.value)
+            return '.'.join(str(v) for v in version_info)
+    raise RuntimeError('__version_info__ not found')
+
+
+__version__ = _read_version()
 version = '.'.join(__version__.split('.')[:2])
 release = __version__
 
-language = None
+language = 'en'
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 pygments_style = 'sphinx'
 todo_include_todos = False
@@ -31,15 +47,28 @@ html_theme_options = {
     # Toc options
     'collapse_navigation': True,
     'sticky_navigation': True,
-    'navigation_depth': 4,
-    'includehidden': True,
+    'navigation_depth': 2,
+    'includehidden': False,
     'titles_only': False
 }
 github_url = 'https://github.com/erdewit/eventkit'
 
 autoclass_content = 'both'
-autodoc_member_order = "bysource"
-autodoc_default_flags = [
-    'members',
-    'undoc-members',
-    ]
+autodoc_member_order = "groupwise"
+autodoc_default_options = {
+    'members': True,
+    'undoc-members': True,
+    'show-inheritance': True,
+}
+autodoc_inherit_docstrings = False
+autodoc_typehints = 'description'
+autodoc_typehints_format = 'short'
+
+autoapi_type = 'python'
+autoapi_dirs = ['../eventkit']
+autoapi_ignore = ['*/tests/*']
+autoapi_generate_api_docs = False
+autoapi_add_toctree_entry = False
+
+# the ops modules and eventkit.event import each other by design
+suppress_warnings = ['autoapi.python_import_resolution']
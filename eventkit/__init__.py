@@ -1,12 +1,16 @@
-"""Event-driven data pipelines."""
+"""
+Event-driven data pipelines.
+
+The array operators are imported on first access, so that numpy
+is only loaded when they are used.
+"""
+
+from typing import TYPE_CHECKING
 
 from .event import Event
 from .ops.aggregate import (
     All, Any, Count, Deque, Ema, List, Max, Mean, Min, Pairwise, Product,
-    Reduce, Sum)
-from .ops.array import (
-    Array, ArrayAll, ArrayAny, ArrayMax, ArrayMean, ArrayMin, ArrayStd,
-    ArraySum)
+    Reduce, RollingMax, RollingMean, RollingMin, RollingStd, RollingSum, Sum)
 from .ops.combine import (
     AddableJoinOp, Chain, Concat, Fork, Merge, Switch, Zip, Ziplatest)
 from .ops.create import (
@@ -21,3 +25,28 @@ from .ops.transform import (
     Enumerate, Iterate, Map, Mergemap, Pack, Partial, PartialRight, Pluck,
     Previous, Star, Switchmap, Timestamp)
 from .version import __version__, __version_info__
+
+if TYPE_CHECKING:
+    from .ops.array import (
+        Array, ArrayAll, ArrayAny, ArrayMax, ArrayMean, ArrayMin, ArrayStd,
+        ArraySum)
+
+_ARRAY_NAMES = (
+    'Array', 'ArrayAll', 'ArrayAny', 'ArrayMax', 'ArrayMean', 'ArrayMin',
+    'ArrayStd', 'ArraySum')
+
+
+def __getattr__(name):
+    """Import the array operators on first access."""
+    if name not in _ARRAY_NAMES:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}')
+    from .ops import array
+    ns = globals()
+    for n in _ARRAY_NAMES:
+        ns[n] = getattr(array, n)
+    return ns[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ARRAY_NAMES))
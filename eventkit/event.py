@@ -1,13 +1,55 @@
 import asyncio
+import functools
 import logging
+import threading
 import types
 import weakref
+from collections import deque
 from typing import (
-    Any as AnyType, AsyncIterable, Awaitable, Iterable, List, Optional,
-    Tuple, Union)
+    Any as AnyType, AsyncIterable, Awaitable, Deque as DequeType, Dict,
+    Iterable, List, Optional, TYPE_CHECKING, Tuple, Union)
 
 from .util import NO_VALUE, get_event_loop, main_event_loop
 
+if TYPE_CHECKING:
+    from .ops.array import Array
+
+_DONE = object()  # marks the end of the stream in Event.aiter
+
+_ensure_future = asyncio.ensure_future
+# result types of listeners that emit can schedule without a hasattr probe
+_AWAITABLE_TYPES = frozenset(
+    (types.CoroutineType, asyncio.Future, asyncio.Task))
+_call_soon_threadsafe = main_event_loop.call_soon_threadsafe
+# (event, args) pairs from emit_threadsafe in order of arrival
+_pending: List[Tuple["Event", Tuple]] = []
+_pending_lock = threading.Lock()  # guards _pending
+
+
+def _emit_pending():
+    with _pending_lock:
+        pending = _pending[:]
+        _pending.clear()
+    for event, args in pending:
+        event.emit(*args)
+
+
+def _split_builtin(c):
+    if type(c.__self__) is type:
+        # built-in method
+        return (c.__self__, c)
+    else:
+        # built-in function
+        return (None, c)
+
+
+# Event._split handlers for the exact types of the common callables
+_split_by_type = {
+    types.FunctionType: lambda c: (None, c),
+    types.MethodType: lambda c: (c.__self__, c.__func__),
+    types.BuiltinMethodType: _split_builtin,
+}
+
 
 class Event:
     """
@@ -21,7 +63,8 @@ class Event:
 
     __slots__ = (
         'error_event', 'done_event', '_name', '_value',
-        '_slots', '_done', '_source', '__weakref__')
+        '_slots', '_snapshot', '_index', '_done', '_source',
+        '__weakref__')
 
     NO_VALUE = NO_VALUE
     logger = logging.getLogger(__name__)
@@ -30,7 +73,9 @@ class Event:
     done_event: Optional["Event"]
     _name: str
     _value: AnyType
-    _slots: List[List]
+    _slots: Dict[int, Tuple]
+    _snapshot: Optional[Tuple[Tuple, ...]]
+    _index: Dict[Tuple, List[Tuple]]
     _done: bool
     _source: Optional["Event"]
 
@@ -48,7 +93,12 @@ class Event:
         if _with_error_done_events:
             self.error_event = Event('error', False)
             self.done_event = Event('done', False)
-        self._slots = []  # list of [obj, weakref, func] sublists
+        # (obj, weakref, func, call) slot tuples keyed by id of the slot
+        self._slots = {}
+        # tuple of the slots for emit to iterate over, None when stale
+        self._snapshot = None
+        # slots per (id of listener object, func) key
+        self._index = {}
         self._name = name or self.__class__.__qualname__
         self._value = NO_VALUE
         self._done = False
@@ -81,8 +131,8 @@ class Event:
         This event's last emitted value.
         """
         v = self._value
-        return NO_VALUE if v is NO_VALUE else \
-            v[0] if len(v) == 1 else v if v else NO_VALUE
+        # NO_VALUE has length 0 and is falsy, same as an empty emit
+        return v[0] if len(v) == 1 else v or NO_VALUE
 
     def connect(self, listener, error=None, done=None,
                 keep_ref: bool = False) -> "Event":
@@ -125,20 +175,48 @@ class Event:
             # let the operator connect itself to this event
             listener.set_source(self)
             return self
-        obj, func = self._split(listener)
-        if not keep_ref and hasattr(obj, '__weakref__'):
-            ref = weakref.ref(obj, self._onFinalize)
-            obj = None
-        else:
-            ref = None
-        slot = [obj, ref, func]
-        self._slots.append(slot)
+        self._add_slot(listener, keep_ref)
         if self.done_event and done is not None:
             self.done_event.connect(done)
         if self.error_event and error is not None:
             self.error_event.connect(error)
         return self
 
+    def connect_many(
+            self, listeners: Iterable, keep_ref: bool = False) -> "Event":
+        """
+        Connect multiple listeners to this event in one go.
+        This is equivalent to calling :meth:`connect` for each
+        listener in turn.
+
+        Args:
+            listeners: The callbacks to invoke on emit of this event.
+            keep_ref: See :meth:`connect`.
+        """
+        add_slot = self._add_slot
+        for listener in listeners:
+            if isinstance(listener, Op):
+                listener.set_source(self)
+            else:
+                add_slot(listener, keep_ref)
+        return self
+
+    def _add_slot(self, listener, keep_ref):
+        obj, func = self._split(listener)
+        key = (id(obj), func)
+        if not keep_ref and type(obj).__weakrefoffset__:
+            ref = weakref.ref(obj, functools.partial(self._onFinalize, key))
+            obj = call = None
+        else:
+            ref = None
+            # bind strong references up front so emit can call directly
+            call = func if obj is None else \
+                obj if func is None else types.MethodType(func, obj)
+        slot = (obj, ref, func, call)
+        self._slots[id(slot)] = slot
+        self._snapshot = None
+        self._index.setdefault(key, []).append(slot)
+
     def disconnect(self, listener, error=None, done=None):
         """
         Disconnect a listener from this event.
@@ -153,12 +231,21 @@ class Event:
             done: The done callback to disconnect.
         """
         obj, func = self._split(listener)
-        for slot in self._slots:
-            if (slot[0] is obj or slot[1] and slot[1]() is obj) \
-                    and slot[2] is func:
-                slot[0] = slot[1] = slot[2] = None
-                break
-        self._slots = [s for s in self._slots if s != [None, None, None]]
+        return self._disconnect_split(obj, func, error, done)
+
+    def _disconnect_split(self, obj, func, error=None, done=None):
+        """
+        Disconnect the listener given as its already split
+        (object, function) pair.
+        """
+        key = (id(obj), func)
+        slots = self._index.get(key)
+        if slots:
+            slot = slots.pop(0)
+            if not slots:
+                del self._index[key]
+            del self._slots[id(slot)]
+            self._snapshot = None
         if error is not None:
             self.error_event.disconnect(error)
         if done is not None:
@@ -174,10 +261,11 @@ class Event:
             obj: The target object that is to be completely removed from
               this event.
         """
-        for slot in self._slots:
-            if slot[0] is obj or slot[1] and slot[1]() is obj:
-                slot[0] = slot[1] = slot[2] = None
-        self._slots = [s for s in self._slots if s != [None, None, None]]
+        obj_id = id(obj)
+        for key in [k for k in self._index if k[0] == obj_id]:
+            for slot in self._index.pop(key):
+                del self._slots[id(slot)]
+            self._snapshot = None
         if self.error_event is not None:
             self.error_event.disconnect_obj(obj)
         if self.done_event is not None:
@@ -191,28 +279,33 @@ class Event:
             args: Argument values to emit to listeners.
         """
         self._value = args
-        for obj, ref, func in self._slots.copy():
+        slots = self._snapshot
+        if slots is None:
+            # connections changed since the last emit
+            slots = self._snapshot = tuple(self._slots.values())
+        for slot in slots:
+            if self._snapshot is not slots and id(slot) not in self._slots:
+                # disconnected by an earlier listener of this emit
+                continue
+            _, ref, func, call = slot
             try:
-                if ref:
+                if call is None:
                     obj = ref()
-
-                result = None
-                if obj is None:
-                    if func:
-                        result = func(*args)
+                    if obj is None:
+                        continue
+                    result = func(obj, *args) if func else obj(*args)
                 else:
-                    if func:
-                        result = func(obj, *args)
-                    else:
-                        result = obj(*args)
+                    result = call(*args)
 
-                if result and hasattr(result, '__await__'):
-                    loop = get_event_loop()
-                    asyncio.ensure_future(result, loop=loop)
+                if result is not None and (
+                        type(result) in _AWAITABLE_TYPES
+                        or hasattr(result, '__await__')):
+                    _ensure_future(result, loop=get_event_loop())
 
             except Exception as error:
-                if len(self.error_event):
-                    self.error_event.emit(self, error)
+                error_event = self.error_event
+                if error_event is not None and error_event._slots:
+                    error_event.emit(self, error)
                 else:
                     Event.logger.exception(
                         f'Value {args} caused exception for event {self}')
@@ -221,16 +314,22 @@ class Event:
         """
         Threadsafe version of :meth:`emit` that doesn't invoke the
         listeners directly but via the event loop of the main thread.
+        Emits that arrive before the loop gets to them are batched,
+        over all events, into a single loop callback.
         """
-        main_event_loop.call_soon_threadsafe(self.emit, *args)
+        with _pending_lock:
+            schedule = not _pending
+            _pending.append((self, args))
+        if schedule:
+            _call_soon_threadsafe(_emit_pending)
 
     def clear(self):
         """
         Disconnect all listeners.
         """
-        for slot in self._slots:
-            slot[0] = slot[1] = slot[2] = None
-        self._slots = []
+        self._slots.clear()
+        self._snapshot = None
+        self._index.clear()
 
     def run(self) -> List:
         """
@@ -309,28 +408,24 @@ class Event:
     def set_source(self, source):
         self._source = source
 
-    def _onFinalize(self, ref):
-        for slot in self._slots:
-            if slot[1] is ref:
-                slot[0] = slot[1] = slot[2] = None
-        self._slots = [s for s in self._slots if s != [None, None, None]]
+    def _onFinalize(self, key, ref):
+        slots = self._index.get(key)
+        if slots:
+            for slot in [s for s in slots if s[1] is ref]:
+                slots.remove(slot)
+                del self._slots[id(slot)]
+            self._snapshot = None
+            if not slots:
+                del self._index[key]
 
     @staticmethod
     def _split(c):
         """
         Split given callable in (object, function) tuple.
         """
-        if isinstance(c, types.FunctionType):
-            return (None, c)
-        elif isinstance(c, types.MethodType):
-            return (c.__self__, c.__func__)
-        elif isinstance(c, types.BuiltinMethodType):
-            if type(c.__self__) is type:
-                # built-in method
-                return (c.__self__, c)
-            else:
-                # built-in function
-                return (None, c)
+        split = _split_by_type.get(type(c))
+        if split is not None:
+            return split(c)
         elif hasattr(c, '__call__'):
             return (c, None)
         else:
@@ -359,34 +454,47 @@ class Event:
                 * ``True``: Always yield arguments as a tuple.
                 * ``False``: Unpack single argument tuples.
         """
+        def wake():
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
+
         def on_event(*args):
             if skip_to_last:
-                while q.qsize():
-                    q.get_nowait()
-            q.put_nowait(('', args))
+                q.clear()
+            q.append(args)
+            wake()
 
         def on_error(source, error):
-            q.put_nowait(('ERROR', error))
+            q.append(error)
+            wake()
 
         def on_done(source):
-            q.put_nowait(('DONE', None))
+            q.append(_DONE)
+            wake()
 
         if self.done():
             return
-        q: asyncio.Queue[Tuple[str, AnyType]] = asyncio.Queue()
+        # the buffer holds args tuples, exceptions or the _DONE marker
+        q: DequeType[AnyType] = deque()
+        waiter: Optional[asyncio.Future] = None
+        loop = asyncio.get_running_loop()
         self.connect(on_event, on_error, on_done)
         try:
             while True:
-                what, args = await q.get()
-                if not what:
-                    yield args if tuples else args[0] if len(args) == 1 \
-                        else args if args else NO_VALUE
-                elif what == 'ERROR':
-                    raise args
-                else:
+                if not q:
+                    waiter = loop.create_future()
+                    await waiter
+                    waiter = None
+                item = q.popleft()
+                if type(item) is tuple:
+                    yield item if tuples else item[0] if len(item) == 1 \
+                        else item if item else NO_VALUE
+                elif item is _DONE:
                     break
+                else:
+                    raise item
         finally:
-            self.disconnect(on_event, on_error, on_done)
+            self._disconnect_split(None, on_event, on_error, on_done)
 
     __iadd__ = connect
     __isub__ = disconnect
@@ -394,7 +502,7 @@ class Event:
     __or__ = pipe
 
     def __repr__(self):
-        return f'Event<{self.name()}, {self._slots}>'
+        return f'Event<{self.name()}, {list(self._slots.values())}>'
 
     def __len__(self):
         return len(self._slots)
@@ -430,7 +538,7 @@ class Event:
                 fut.set_exception(error)
 
         def on_future_done(f):
-            self.disconnect(on_event, on_error)
+            self._disconnect_split(None, on_event, on_error)
 
         if self.done():
             raise ValueError('Event already done')
@@ -455,9 +563,7 @@ class Event:
         See if callable is already connected.
         """
         obj, func = self._split(c)
-        return any(
-            (s[0] is obj or s[1] and s[1]() is obj) and s[2] is func
-            for s in self._slots)
+        return (id(obj), func) in self._index
 
     def __reduce__(self):
         """
@@ -567,7 +673,7 @@ class Event:
             times: Relative times for individual values, in seconds since
                 start of event. The sequence should match ``values``.
         """
-        return Repeat(interval, value, count, times)
+        return Repeat(value, count, interval, times)
 
     @staticmethod
     def range(
@@ -996,12 +1102,14 @@ class Event:
     def any(self) -> "Any":
         """
         Test if predicate holds for at least one source value.
+        Ends as soon as a true value is seen.
         """
         return Any(self)
 
     def all(self) -> "All":
         """
         Test if predicate holds for all source values.
+        Ends as soon as a false value is seen.
         """
         return All(self)
 
@@ -1019,6 +1127,52 @@ class Event:
         """
         return Ema(n, weight, self)
 
+    def rolling_sum(self, count: int) -> "RollingSum":
+        """
+        Sum of the last ``count`` source values.
+
+        Args:
+            count: Number of last periods to use, or 0 to use all.
+        """
+        return RollingSum(count, self)
+
+    def rolling_mean(self, count: int) -> "RollingMean":
+        """
+        Average of the last ``count`` source values.
+
+        Args:
+            count: Number of last periods to use, or 0 to use all.
+        """
+        return RollingMean(count, self)
+
+    def rolling_std(self, count: int) -> "RollingStd":
+        """
+        Sample standard deviation of the last ``count`` source values.
+        Emits ``nan`` for the first value.
+
+        Args:
+            count: Number of last periods to use, or 0 to use all.
+        """
+        return RollingStd(count, self)
+
+    def rolling_min(self, count: int) -> "RollingMin":
+        """
+        Minimum of the last ``count`` source values.
+
+        Args:
+            count: Number of last periods to use, or 0 to use all.
+        """
+        return RollingMin(count, self)
+
+    def rolling_max(self, count: int) -> "RollingMax":
+        """
+        Maximum of the last ``count`` source values.
+
+        Args:
+            count: Number of last periods to use, or 0 to use all.
+        """
+        return RollingMax(count, self)
+
     def previous(self, count: int = 1) -> "Previous":
         """
         For every source value, emit the ``count``-th previous value::
@@ -1057,7 +1211,8 @@ class Event:
         Args:
             key: `The callable `'key(value)`` is used to group values.
                 The default of ``None`` groups values by equality.
-                The resulting group must be hashable.
+                Hashable groups are looked up in a set, unhashable
+                groups fall back to a linear scan.
         """
         return Unique(key, self)
 
@@ -1091,6 +1246,8 @@ class Event:
         Args:
             count: Number of last periods to use, or 0 to use all.
         """
+        # imported here to keep numpy out of the package import
+        from .ops.array import Array
         return Array(count, self)
 
     def chunk(self, size: int) -> "Chunk":
@@ -1312,10 +1469,8 @@ class Event:
 
 from .ops.aggregate import (
     All, Any, Count, Deque, Ema, List as ListOp, Max, Mean, Min, Pairwise,
-    Product, Reduce, Sum)
-from .ops.array import (
-    Array, ArrayAll, ArrayAny, ArrayMax, ArrayMean, ArrayMin, ArrayProd,
-    ArrayStd, ArraySum)
+    Product, Reduce, RollingMax, RollingMean, RollingMin, RollingStd,
+    RollingSum, Sum)
 from .ops.combine import (
     AddableJoinOp, Chain, Concat, Fork, Merge, Switch, Zip, Ziplatest)
 from .ops.create import (
@@ -1 +1,24 @@
 """Event operators."""
+
+import importlib.util
+import sys
+
+
+def _lazy_module(name):
+    """
+    Register the submodule ``name`` without executing it. The module body
+    runs on the first attribute access.
+    """
+    spec = importlib.util.find_spec(name)
+    assert spec and spec.loader
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# the array operators need numpy, which is slow to import
+if __name__ + '.array' not in sys.modules:
+    globals()['array'] = _lazy_module(__name__ + '.array')
@@ -1,4 +1,5 @@
 import itertools
+import math
 import operator
 from collections import deque
 
@@ -41,6 +42,12 @@ class Min(Reduce):
 
     def __init__(self, source=None):
         Reduce.__init__(self, min, float('inf'), source)
+        self._prev = self._initializer
+
+    def on_source(self, arg):
+        if arg < self._prev:
+            self._prev = arg
+        self.emit(self._prev)
 
 
 class Max(Reduce):
@@ -48,6 +55,12 @@ class Max(Reduce):
 
     def __init__(self, source=None):
         Reduce.__init__(self, max, -float('inf'), source)
+        self._prev = self._initializer
+
+    def on_source(self, arg):
+        if arg > self._prev:
+            self._prev = arg
+        self.emit(self._prev)
 
 
 class Sum(Reduce):
@@ -55,6 +68,11 @@ class Sum(Reduce):
 
     def __init__(self, start=0, source=None):
         Reduce.__init__(self, operator.add, start, source)
+        self._prev = start
+
+    def on_source(self, arg):
+        self._prev = self._prev + arg
+        self.emit(self._prev)
 
 
 class Product(Reduce):
@@ -62,53 +80,74 @@ class Product(Reduce):
 
     def __init__(self, start=1, source=None):
         Reduce.__init__(self, operator.mul, start, source)
+        self._prev = start
+
+    def on_source(self, arg):
+        self._prev = self._prev * arg
+        self.emit(self._prev)
 
 
 class Mean(Op):
-    __slots__ = ('_count', '_sum')
+    __slots__ = ('_count', '_mean')
 
     def __init__(self, source=None):
         Op.__init__(self, source)
         self._count = 0
-        self._sum = 0
+        self._mean = 0.0
 
     def on_source(self, arg):
+        # Welford's running mean, stable for long streams
         self._count += 1
-        self._sum += arg
-        self.emit(self._sum / self._count)
+        self._mean += (arg - self._mean) / self._count
+        self.emit(self._mean)
 
 
-class Any(Reduce):
+class Any(Op):
     __slots__ = ()
 
-    def __init__(self, source=None):
-        Reduce.__init__(self, lambda prev, v: prev or bool(v), False, source)
+    def on_source(self, arg):
+        if arg:
+            # the outcome is settled, so stop listening
+            self.emit(True)
+            Op.on_source_done(self, self._source)
+        else:
+            self.emit(False)
 
 
-class All(Reduce):
+class All(Op):
     __slots__ = ()
 
-    def __init__(self, source=None):
-        Reduce.__init__(self, lambda prev, v: prev and bool(v), True, source)
+    def on_source(self, arg):
+        if arg:
+            self.emit(True)
+        else:
+            # the outcome is settled, so stop listening
+            self.emit(False)
+            Op.on_source_done(self, self._source)
 
 
 class Ema(Op):
-    __slots__ = ('_f1', '_f2', '_prev')
+    __slots__ = ('_f1', '_prev')
 
     def __init__(self, n=None, weight=None, source=None):
         Op.__init__(self, source)
         self._f1 = weight or 2.0 / (n + 1)
-        self._f2 = 1 - self._f1
         self._prev = NO_VALUE
 
-    def on_source(self, *args):
-        if self._prev is NO_VALUE:
-            value = args
+    def on_source(self, value=NO_VALUE, *rest):
+        prev = self._prev
+        if rest:
+            values = (value,) + rest
+            if prev is not NO_VALUE:
+                f1 = self._f1
+                values = [p + f1 * (a - p) for p, a in zip(prev, values)]
+            self._prev = values
+            self.emit(*values)
         else:
-            value = [
-                self._f2 * p + self._f1 * a for p, a in zip(self._prev, args)]
-        self._prev = value
-        self.emit(*value)
+            if prev is not NO_VALUE:
+                value = prev + self._f1 * (value - prev)
+            self._prev = value
+            self.emit(value)
 
 
 class Pairwise(Op):
@@ -118,8 +157,9 @@ class Pairwise(Op):
         Op.__init__(self, source)
         self._has_prev = False
 
-    def on_source(self, *args):
-        value = args[0] if len(args) == 1 else args if args else NO_VALUE
+    def on_source(self, value=NO_VALUE, *rest):
+        if rest:
+            value = (value,) + rest
         if self._has_prev:
             self.emit(self._prev, value)
         else:
@@ -128,15 +168,16 @@ class Pairwise(Op):
 
 
 class List(Op):
-    __slots__ = ('_values')
+    __slots__ = ('_values',)
 
     def __init__(self, source=None):
         Op.__init__(self, source)
         self._values = []
 
-    def on_source(self, *args):
-        self._values.append(
-            args[0] if len(args) == 1 else args if args else NO_VALUE)
+    def on_source(self, value=NO_VALUE, *rest):
+        if rest:
+            value = (value,) + rest
+        self._values.append(value)
 
     def on_source_done(self, source):
         self.emit(self._values)
@@ -144,16 +185,131 @@ class List(Op):
 
 
 class Deque(Op):
-    __slots__ = ('_count', '_q')
+    __slots__ = ('_q',)
 
     def __init__(self, count, source=None):
         Op.__init__(self, source)
-        self._count = count
-        self._q = deque()
+        self._q = deque(maxlen=count or None)
 
-    def on_source(self, *args):
-        self._q.append(
-            args[0] if len(args) == 1 else args if args else NO_VALUE)
-        if self._count and len(self._q) > self._count:
-            self._q.popleft()
+    def on_source(self, value=NO_VALUE, *rest):
+        if rest:
+            value = (value,) + rest
+        self._q.append(value)
         self.emit(self._q)
+
+
+class RollingSum(Op):
+    __slots__ = ('_q', '_sum')
+
+    def __init__(self, count, source=None):
+        Op.__init__(self, source)
+        # count 0 uses all values, which needs no window
+        self._q = deque(maxlen=count) if count else None
+        self._sum = 0
+
+    def on_source(self, arg):
+        q = self._q
+        if q is not None:
+            if len(q) == q.maxlen:
+                self._sum -= q[0]
+            q.append(arg)
+        self._sum += arg
+        self.emit(self._sum)
+
+
+class RollingMean(RollingSum):
+    __slots__ = ('_n',)
+
+    def __init__(self, count, source=None):
+        RollingSum.__init__(self, count, source)
+        self._n = 0
+
+    def on_source(self, arg):
+        q = self._q
+        if q is None:
+            self._n += 1
+            n = self._n
+        else:
+            if len(q) == q.maxlen:
+                self._sum -= q[0]
+            q.append(arg)
+            n = len(q)
+        self._sum += arg
+        self.emit(self._sum / n)
+
+
+class RollingStd(Op):
+    __slots__ = ('_q', '_n', '_mean', '_m2')
+
+    def __init__(self, count, source=None):
+        Op.__init__(self, source)
+        # count 0 uses all values, which needs no window
+        self._q = deque(maxlen=count) if count else None
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def on_source(self, arg):
+        # Welford's update, with the oldest value swapped out once full
+        q = self._q
+        n = self._n
+        mean = self._mean
+        if q is not None and n == q.maxlen:
+            old = q[0]
+            self._mean += (arg - old) / n
+            self._m2 += (arg - old) * (arg - self._mean + old - mean)
+        else:
+            n = self._n = n + 1
+            self._mean += (arg - mean) / n
+            self._m2 += (arg - mean) * (arg - self._mean)
+        if q is not None:
+            q.append(arg)
+        self.emit(
+            math.sqrt(max(self._m2, 0.0) / (n - 1)) if n > 1 else math.nan)
+
+
+class RollingMin(Op):
+    __slots__ = ('_count', '_i', '_q', '_best')
+
+    def __init__(self, count, source=None):
+        Op.__init__(self, source)
+        self._count = count
+        self._i = 0
+        # (index, value) pairs with increasing values, or None when
+        # count 0 uses all values and only the best one is kept
+        self._q = deque() if count else None
+        self._best = NO_VALUE
+
+    def on_source(self, arg):
+        q = self._q
+        if q is None:
+            if self._best is NO_VALUE or arg < self._best:
+                self._best = arg
+            self.emit(self._best)
+        else:
+            while q and q[-1][1] >= arg:
+                q.pop()
+            q.append((self._i, arg))
+            if q[0][0] <= self._i - self._count:
+                q.popleft()
+            self._i += 1
+            self.emit(q[0][1])
+
+
+class RollingMax(RollingMin):
+    __slots__ = ()
+
+    def on_source(self, arg):
+        q = self._q
+        if q is None:
+            if self._best is NO_VALUE or arg > self._best:
+                self._best = arg
+            self.emit(self._best)
+        else:
+            while q and q[-1][1] <= arg:
+                q.pop()
+            q.append((self._i, arg))
+            if q[0][0] <= self._i - self._count:
+                q.popleft()
+            self._i += 1
+            self.emit(q[0][1])
@@ -7,19 +7,85 @@ from ..util import NO_VALUE
 
 
 class Array(Op):
-    __slots__ = ('_count', '_q')
+    __slots__ = ('_count', '_buf', '_head', '_size')
 
     def __init__(self, count, source=None):
         Op.__init__(self, source)
         self._count = count
-        self._q = deque()
-
-    def on_source(self, *args):
-        self._q.append(
-            args[0] if len(args) == 1 else args if args else NO_VALUE)
-        if self._count and len(self._q) > self._count:
-            self._q.popleft()
-        self.emit(np.asarray(self._q))
+        # allocated on first value; when bounded, every value is written
+        # twice, count rows apart, so that the window is always the
+        # contiguous slice buf[head:head + count]
+        self._buf = None
+        self._head = 0  # index where the next value is written
+        self._size = 0
+
+    def on_source(self, value=NO_VALUE, *rest):
+        if rest:
+            value = (value,) + rest
+        a = np.asarray(value)
+        buf = self._buf
+        if buf is None:
+            buf = self._buf = np.empty(
+                (2 * self._count or 16,) + a.shape, a.dtype)
+        elif buf.ndim == 1 and buf.dtype == object:
+            # ragged values: every value fits, no rebuild needed
+            pass
+        elif a.shape != buf.shape[1:] or not np.can_cast(a.dtype, buf.dtype):
+            self._rebuild(a)
+            buf = self._buf
+        if buf.dtype != object:
+            item = a
+        elif buf.ndim == 1 and a.ndim:
+            # ragged rows are kept as arrays, like the rows copied over
+            # from a regular buffer
+            item = a
+        else:
+            item = value
+        head = self._head
+        count = self._count
+        if count:
+            buf[head] = item
+            buf[head + count] = item
+            head = self._head = (head + 1) % count
+            if self._size < count:
+                self._size += 1
+                self.emit(buf[:self._size].copy())
+            else:
+                self.emit(buf[head:head + count].copy())
+        else:
+            if head == len(buf):
+                # unbounded: grow geometrically
+                grown = np.empty((2 * head,) + buf.shape[1:], buf.dtype)
+                grown[:head] = buf
+                buf = self._buf = grown
+            buf[head] = item
+            self._head = self._size = head + 1
+            self.emit(buf[:head + 1].copy())
+
+    def _rebuild(self, a):
+        # the new value doesn't fit: move the window to a buffer
+        # with a dtype (and shape) that can hold all values
+        buf = self._buf
+        count = self._count
+        if count and self._size == count:
+            window = buf[self._head:self._head + count]
+        else:
+            window = buf[:self._size]
+        if a.shape == buf.shape[1:]:
+            new = np.empty(buf.shape, np.result_type(buf.dtype, a.dtype))
+            new[:len(window)] = window
+        else:
+            # ragged values are kept as objects
+            new = np.empty(len(buf), object)
+            for i, v in enumerate(window):
+                # scalars as plain values, rows as arrays
+                new[i] = v.item() if type(v) is not np.ndarray else v
+        if count:
+            new[count:count + len(window)] = new[:len(window)]
+            self._head = len(window) % count
+        else:
+            self._head = len(window)
+        self._buf = new
 
     def min(self) -> "ArrayMin":  # type: ignore
         """
@@ -109,18 +175,32 @@ class ArrayStd(Op):
     __slots__ = ()
 
     def on_source(self, arg):
-        self.emit(arg.std(ddof=1) if len(arg) > 1 else np.nan)
+        if len(arg) > 1:
+            d = arg - arg.mean()
+            self.emit(np.sqrt(np.vdot(d, d).real / (d.size - 1)))
+        else:
+            self.emit(np.nan)
+
+
+# above this size a short-circuiting any/all beats count_nonzero
+_COUNT_NONZERO_MAX = 1024
 
 
 class ArrayAny(Op):
     __slots__ = ()
 
     def on_source(self, arg):
-        self.emit(arg.any())
+        if arg.dtype == bool or arg.size <= _COUNT_NONZERO_MAX:
+            self.emit(np.count_nonzero(arg) > 0)
+        else:
+            self.emit(bool(arg.any()))
 
 
 class ArrayAll(Op):
     __slots__ = ()
 
     def on_source(self, arg):
-        self.emit(arg.all())
+        if arg.dtype == bool or arg.size <= _COUNT_NONZERO_MAX:
+            self.emit(np.count_nonzero(arg) == arg.size)
+        else:
+            self.emit(bool(arg.all()))
@@ -1,5 +1,5 @@
 import functools
-from collections import defaultdict, deque
+from collections import deque
 from typing import Deque, Optional
 
 from .op import Op
@@ -76,6 +76,16 @@ class AddableJoinOp(JoinOp):
         # note: the same source can be added multiple times
         raise NotImplementedError
 
+    def _connect_source_cb(self, source, method):
+        """
+        Connect ``method(source, *args)`` to the source, at most once
+        per source. For operators that keep a ``_source2cb`` map.
+        """
+        if source not in self._source2cb:
+            cb = functools.partial(method, source)
+            self._source2cb[source] = cb
+            source.connect(cb, done=self.on_source_done, keep_ref=True)
+
     def set_parent(self, parent: Event):
         self._parent = parent
         if parent.done_event:
@@ -113,11 +123,7 @@ class Switch(AddableJoinOp):
 
     def add_source(self, source):
         self._sources.append(source)
-        cb = self._source2cb.get(source)
-        if not cb:
-            cb = functools.partial(self.on_source_s, source)
-            self._source2cb[source] = cb
-            source.connect(cb, done=self.on_source_done)
+        self._connect_source_cb(source, self.on_source_s)
 
     def _remove_source(self, source):
         if source in self._sources:
@@ -151,11 +157,7 @@ class Concat(AddableJoinOp):
         if source in self._sources:
             return
         self._sources.append(source)
-        cb = self._source2cb.get(source)
-        if not cb:
-            cb = functools.partial(self._on_source_s, source)
-            self._source2cb[source] = cb
-            source.connect(cb, done=self.on_source_done)
+        self._connect_source_cb(source, self._on_source_s)
 
     def _on_source_s(self, source, *args):
         while self._sources and self._sources[0] is not source:
@@ -180,7 +182,7 @@ class Chain(AddableJoinOp):
     def __init__(self, *sources):
         AddableJoinOp.__init__(self)
         self._qq = deque()
-        self._source2cbs = defaultdict(list)  # map from source to callbacks
+        self._source2cbs = {}  # map from source to callbacks
         self._set_sources(*sources)
 
     def add_source(self, source):
@@ -192,7 +194,7 @@ class Chain(AddableJoinOp):
             q = deque()
             self._qq.append(q)
             source += cb
-            self._source2cbs[source].append(cb)
+            self._source2cbs.setdefault(source, []).append(cb)
         self._sources.append(source)
 
     def on_source_done(self, source):
@@ -217,12 +219,15 @@ class Chain(AddableJoinOp):
 
 
 class Zip(JoinOp):
-    __slots__ = ('_results', '_source2cbs', '_num_ready')
+    __slots__ = (
+        '_values', '_backlog', '_filled', '_backlogged', '_full',
+        '_source_cbs')
 
     def __init__(self, *sources):
         JoinOp.__init__(self)
-        self._num_ready = 0  # number of sources with a pending result
-        self._source2cbs = defaultdict(list)  # map from source to callbacks
+        self._filled = 0  # bitmask of sources with a pending value
+        self._backlogged = 0  # bitmask of sources with a non-empty backlog
+        self._source_cbs = []  # (source, callback) pairs
         if sources:
             self._set_sources(*sources)
 
@@ -231,43 +236,56 @@ class Zip(JoinOp):
         if any(s.done() for s in self._sources):
             self.set_done()
             return
-        self._results = [deque() for _ in self._sources]
+        n = len(self._sources)
+        self._values = [NO_VALUE] * n
+        # values that arrive while the source already has one pending
+        self._backlog = [deque() for _ in range(n)]
+        self._full = (1 << n) - 1
         for i, source in enumerate(self._sources):
             cb = functools.partial(self._on_source_i, i)
-            source.connect(cb, self.on_source_error, self.on_source_done)
-            self._source2cbs[source].append(cb)
-
-    def _on_source_i(self, i, *args):
-        q = self._results[i]
-        if not q:
-            self._num_ready += 1
-            ready = self._num_ready == len(self._results)
-        else:
-            ready = False
-        q.append(args[0] if len(args) == 1 else args if args else NO_VALUE)
-        if ready:
-            tup = tuple(q.popleft() for q in self._results)
-            self._num_ready = sum(bool(q) for q in self._results)
-            self.emit(*tup)
+            source.connect(
+                cb, self.on_source_error, self.on_source_done, keep_ref=True)
+            self._source_cbs.append((source, cb))
+
+    def _on_source_i(self, i, value=NO_VALUE, *rest):
+        if rest:
+            value = (value,) + rest
+        bit = 1 << i
+        if self._filled & bit:
+            self._backlog[i].append(value)
+            self._backlogged |= bit
+            return
+        self._values[i] = value
+        self._filled |= bit
+        if self._filled == self._full:
+            values = self._values
+            self._values = [NO_VALUE] * len(values)
+            self._filled = self._backlogged
+            if self._backlogged:
+                for j, q in enumerate(self._backlog):
+                    if q:
+                        self._values[j] = q.popleft()
+                        if not q:
+                            self._backlogged &= ~(1 << j)
+            self.emit(*values)
 
     def on_source_done(self, source):
         self._sources.remove(source)
         if not self._sources:
-            for source, cbs in self._source2cbs.items():
-                for cb in cbs:
-                    source.disconnect(
-                        cb, self.on_source_error, self.on_source_done)
-            self._source2cbs = None
+            for source, cb in self._source_cbs:
+                source.disconnect(
+                    cb, self.on_source_error, self.on_source_done)
+            self._source_cbs = None
             self.set_done()
 
 
 class Ziplatest(JoinOp):
-    __slots__ = ('_values', '_is_primed', '_source2cbs')
+    __slots__ = ('_values', '_is_primed', '_unprimed', '_source_cbs')
 
     def __init__(self, *sources, partial=True):
         JoinOp.__init__(self)
         self._is_primed = partial
-        self._source2cbs = defaultdict(list)  # map from source to callbacks
+        self._source_cbs = []  # (source, callback) pairs
         if sources:
             self._set_sources(*sources)
 
@@ -278,25 +296,34 @@ class Ziplatest(JoinOp):
             self.set_done()
             return
         self._values = [s.value() for s in sources]
-        for i, source in enumerate(self._sources):
+        self._unprimed = sum(v is NO_VALUE for v in self._values)
+        for i, source in enumerate(sources):
+            if source.done():
+                continue
             cb = functools.partial(self._on_source_i, i)
-            source.connect(cb, self.on_source_error, self.on_source_done)
-            self._source2cbs[source].append(cb)
+            source.connect(
+                cb, self.on_source_error, self.on_source_done, keep_ref=True)
+            self._source_cbs.append((source, cb))
 
-    def _on_source_i(self, i, *args):
-        self._values[i] = \
-            args[0] if len(args) == 1 else args if args else NO_VALUE
+    def _on_source_i(self, i, value=NO_VALUE, *rest):
+        if rest:
+            value = (value,) + rest
         if not self._is_primed:
-            self._is_primed = not any(r is NO_VALUE for r in self._values)
+            prev = self._values[i]
+            if prev is NO_VALUE and value is not NO_VALUE:
+                self._unprimed -= 1
+            elif prev is not NO_VALUE and value is NO_VALUE:
+                self._unprimed += 1
+            self._is_primed = not self._unprimed
+        self._values[i] = value
         if self._is_primed:
             self.emit(*self._values)
 
     def on_source_done(self, source):
         self._sources.remove(source)
         if not self._sources:
-            for source, cbs in self._source2cbs.items():
-                for cb in cbs:
-                    source.disconnect(
-                        cb, self.on_source_error, self.on_source_done)
-            self._source2cbs = None
+            for source, cb in self._source_cbs:
+                source.disconnect(
+                    cb, self.on_source_error, self.on_source_done)
+            self._source_cbs = None
             self.set_done()
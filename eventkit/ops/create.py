@@ -1,6 +1,5 @@
 import asyncio
 import itertools
-import time
 
 from .op import Op
 from ..event import Event
@@ -41,7 +40,7 @@ class Aiterate(Event):
     def __init__(self, ait):
         Event.__init__(self, ait.__qualname__)
         loop = get_event_loop()
-        self._task = asyncio.ensure_future(self._looper(ait), loop=loop)
+        self._task = loop.create_task(self._looper(ait))
 
     async def _looper(self, ait):
         try:
@@ -57,30 +56,56 @@ class Aiterate(Event):
             self._task.cancel()
 
 
-class Sequence(Aiterate):
-    __slots__ = ()
+class Sequence(Event):
+    __slots__ = (
+        '_values', '_times', '_interval', '_i', '_t0', '_time', '_call_at')
 
     def __init__(self, values, interval=0, times=None):
-        async def sequence():
-            t0 = time.time()
-            if times is not None:
-                for t, value in zip(times, values):
-                    delay = max(0, time.time() + t - t0)
-                    await asyncio.sleep(delay)
-                    yield value
+        Event.__init__(self)
+        loop = get_event_loop()
+        self._time = loop.time
+        self._call_at = loop.call_at
+        self._values = iter(values)
+        self._times = None if times is None else iter(times)
+        self._interval = interval
+        self._i = 0
+        self._t0 = 0
+        # start the clock once the loop runs
+        loop.call_soon(self._start)
+
+    def _start(self):
+        self._t0 = self._time()
+        self._schedule()
+
+    def _schedule(self):
+        # fetch the next value and the time to emit it at
+        try:
+            if self._times is not None:
+                t = next(self._times)
             else:
-                for i, value in enumerate(values):
-                    delay = max(0, i * interval + t0 - time.time())
-                    await asyncio.sleep(delay)
-                    yield value
-        Aiterate.__init__(self, sequence())
+                t = self._i * self._interval
+                self._i += 1
+            value = next(self._values)
+        except StopIteration:
+            self.set_done()
+            return
+        except Exception as error:
+            self.error_event.emit(self, error)
+            self.set_done()
+            return
+        self._call_at(self._t0 + t, self._fire, value)
+
+    def _fire(self, value):
+        self.emit(value)
+        self._schedule()
 
 
 class Repeat(Sequence):
     __slots__ = ()
 
     def __init__(self, value, count, interval=0, times=None):
-        Sequence.__init__(self, itertools.repeat(count), interval, times)
+        Sequence.__init__(
+            self, itertools.repeat(value, count), interval, times)
 
 
 class Range(Sequence):
@@ -97,27 +122,60 @@ class Timerange(Aiterate):
         Aiterate.__init__(self, timerange(start, end, step))
 
 
-class Timer(Aiterate):
-    __slots__ = ()
+class Timer(Event):
+    __slots__ = ('_interval', '_count', '_i', '_t0', '_time', '_call_at')
 
     def __init__(self, interval, count=None):
-        async def timer():
-            t0 = time.time()
-            i = 0
-            while count is None or i < count:
-                i += 1
-                delay = i * interval + t0 - time.time()
-                await asyncio.sleep(delay)
-                yield i * interval
-        Aiterate.__init__(self, timer())
+        Event.__init__(self)
+        loop = get_event_loop()
+        self._time = loop.time
+        self._call_at = loop.call_at
+        self._interval = interval
+        self._count = count
+        self._i = 0
+        self._t0 = 0
+        # start the clock once the loop runs
+        loop.call_soon(self._start)
+
+    def _start(self):
+        self._t0 = self._time()
+        self._schedule()
+
+    def _schedule(self):
+        if self._count is not None and self._i >= self._count:
+            self.set_done()
+            return
+        self._i += 1
+        self._call_at(self._t0 + self._i * self._interval, self._fire)
+
+    def _fire(self):
+        self.emit(self._i * self._interval)
+        self._schedule()
 
 
 class Marble(Op):
     __slots__ = ()
 
     def __init__(self, s, interval=0, times=None):
-        s = s.replace('_', '')
-        source = Event.sequence(s, interval, times) \
-            .filter(lambda c: c not in '- ') \
-            .takewhile(lambda c: c != '|')
+        source = Event.sequence(_marble_chars(s), interval, times) \
+            .filter(_is_marble_value) \
+            .takewhile(_is_not_marble_end)
         Op.__init__(self, source)
+
+
+def _marble_chars(s):
+    """
+    Strip the marble string of underscores and of anything after
+    the end marker.
+    """
+    s = s.replace('_', '')
+    end = s.find('|')
+    return s if end < 0 else s[:end + 1]
+
+
+def _is_marble_value(c):
+    return c not in '- '
+
+
+def _is_not_marble_end(c):
+    return c != '|'
@@ -3,15 +3,16 @@ from ..event import Event
 
 
 class Errors(Event):
-    __slots__ = ('_source',)
+    __slots__ = ()
 
     def __init__(self, source=None):
         Event.__init__(self)
         self._source = source
-        if source is not None and source.done():
-            self.set_done()
-        else:
-            source.error_event += self.emit
+        if source is not None:
+            if source.done():
+                self.set_done()
+            else:
+                source.error_event.connect(self.emit, keep_ref=True)
 
 
 class EndOnError(Op):
@@ -20,7 +21,6 @@ class EndOnError(Op):
     def __init__(self, source=None):
         Op.__init__(self, source)
 
-    def on_source_error(self, error):
-        self.disconnect_from(self._source)
-        self.error_event.emit(error)
-        self.set_done()
+    def on_source_error(self, source, error):
+        Op.on_source_error(self, source, error)
+        Op.on_source_done(self, source)
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Callable, Optional, Tuple, Union
 
 from ..event import Event
 
@@ -15,20 +15,46 @@ class Op(Event):
 
     The default handlers will pass along source emits, errors and done events.
     This makes ``Op`` also suitable as an identity operator.
+
+    Chains of simple operators are fused: when a fusable operator gets
+    a source operator that has a ``_step`` method and no other
+    listeners, it connects directly to the upstream event of that source
+    and runs the ``_step`` of the source inline. A ``_step(args)``
+    returns the args to pass on, or ``None`` to drop the value.
+    Only the hop from upstream is bypassed: the fusable operator stays
+    connected to the source operator, so values that the source
+    operator emits itself still arrive. The source operator opts in by
+    setting ``_fused_on_source`` to the ``on_source`` that its ``_step``
+    stands in for, so a subclass that overrides ``on_source`` is never
+    fused. The fusion is undone as soon as anything else connects to
+    the source operator, and when an error arrives from upstream.
     """
 
-    __slots__ = ()
+    __slots__ = ('_fused', '_fused_into')
+
+    _fused: Optional[Tuple[Event, Callable, Tuple["Op", ...]]]
+    _fused_into: Optional["Op"]
+
+    _fusable = False  # can absorb a source operator that has a _step
+    _step = None
+    # the on_source that _step stands in for, for ops that can be absorbed
+    _fused_on_source: Optional[Callable] = None
 
     def __init__(self, source: Union[Event, None] = None):
         Event.__init__(self)
+        # (upstream event, fused callable, absorbed ops) when fused
+        self._fused = None
+        # the op that this op has been fused into
+        self._fused_into = None
         if source is not None:
             self.set_source(source)
 
     on_source = Event.emit
 
     def on_source_error(self, source, error):
-        if len(self.error_event):
-            self.error_event.emit(source, error)
+        error_event = self.error_event
+        if error_event is not None and error_event._slots:
+            error_event.emit(source, error)
         else:
             Event.logger.exception(error)
 
@@ -49,15 +75,117 @@ class Op(Event):
     def _connect_from(self, source: Event):
         if source.done():
             self.set_done()
-        else:
-            source.connect(
-                self.on_source,
-                self.on_source_error,
-                self.on_source_done,
-                keep_ref=True)
+            return
+        source.connect(
+            self.on_source,
+            self.on_source_error,
+            self.on_source_done,
+            keep_ref=True)
+        if (
+                self._fusable and isinstance(source, Op)
+                and type(source).on_source is type(source)._fused_on_source
+                and source._fused_into is None
+                and source._source is not None
+                # no listeners other than this op
+                and len(source._slots) == 1
+                and source.error_event is not None
+                and len(source.error_event._slots) == 1
+                and source.done_event is not None
+                and len(source.done_event._slots) == 1):
+            self._fuse(source)
 
     def _disconnect_from(self, source: Event):
+        if self._fused is not None and source is self._source:
+            self._unfuse()
         source.disconnect(
             self.on_source,
             self.on_source_error,
             self.on_source_done)
+
+    def _add_slot(self, listener, keep_ref):
+        if self._fused_into is not None:
+            # a listener of our own needs the unfused chain
+            self._fused_into._unfuse()
+        Event._add_slot(self, listener, keep_ref)
+
+    def _fuse(self, source: "Op"):
+        """
+        Take over the connection of the source op to its upstream event.
+        The connection of this op to the source op stays in place, so
+        that values emitted by the source op itself still arrive.
+        """
+        upstream: Optional[Event]
+        if source._fused is not None:
+            upstream, call, ops = source._fused
+            upstream.disconnect(
+                call, source._on_fused_error, source._on_fused_done)
+            source._fused = None
+            ops += (source,)
+        else:
+            upstream = source._source
+            assert upstream is not None
+            source._disconnect_from(upstream)
+            ops = (source,)
+        call = _fused_call(ops, self.on_source)
+        for op in ops:
+            op._fused_into = self
+        self._fused = (upstream, call, ops)
+        upstream.connect(
+            call, self._on_fused_error, self._on_fused_done, keep_ref=True)
+
+    def _unfuse(self):
+        """
+        Restore the connection of the first absorbed op to upstream.
+        """
+        upstream, call, ops = self._fused
+        self._fused = None
+        upstream.disconnect(
+            call, self._on_fused_error, self._on_fused_done)
+        for op in ops:
+            op._fused_into = None
+        first = ops[0]
+        upstream.connect(
+            first.on_source,
+            first.on_source_error,
+            first.on_source_done,
+            keep_ref=True)
+        return ops
+
+    def _on_fused_error(self, upstream, error):
+        # let the error pass through the error events of the absorbed ops
+        ops = self._unfuse()
+        ops[0].on_source_error(upstream, error)
+
+    def _on_fused_done(self, upstream):
+        # let the done event cascade through the unfused chain
+        ops = self._unfuse()
+        ops[0].on_source_done(upstream)
+
+
+def _fused_call(ops, on_source):
+    """
+    Combine the steps of the absorbed ops and the ``on_source``
+    of the op at the end of the chain into one listener.
+    The absorbed ops keep their last value up to date, as emit would.
+    """
+    if len(ops) == 1:
+        op = ops[0]
+        step = op._step
+
+        def call(*args):
+            args = step(args)
+            if args is not None:
+                op._value = args
+                on_source(*args)
+    else:
+        steps = tuple((op, op._step) for op in ops)
+
+        def call(*args):
+            for op, step in steps:
+                args = step(args)
+                if args is None:
+                    return
+                op._value = args
+            on_source(*args)
+
+    return call
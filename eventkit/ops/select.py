@@ -5,6 +5,8 @@ from ..util import NO_VALUE
 class Filter(Op):
     __slots__ = ('_predicate',)
 
+    _fusable = True
+
     def __init__(self, predicate=bool, source=None):
         Op.__init__(self, source)
         self._predicate = predicate
@@ -13,6 +15,12 @@ class Filter(Op):
         if self._predicate(*args):
             self.emit(*args)
 
+    def _step(self, args):
+        if self._predicate(*args):
+            return args
+
+    _fused_on_source = on_source
+
 
 class Skip(Op):
     __slots__ = ('_count', '_n')
@@ -32,6 +40,8 @@ class Skip(Op):
 class Take(Op):
     __slots__ = ('_count', '_n')
 
+    _fusable = True
+
     def __init__(self, count=1, source=None):
         Op.__init__(self, source)
         self._count = count
@@ -49,6 +59,8 @@ class Take(Op):
 class TakeWhile(Op):
     __slots__ = ('_predicate',)
 
+    _fusable = True
+
     def __init__(self, predicate=bool, source=None):
         Op.__init__(self, source)
         self._predicate = predicate
@@ -60,10 +72,22 @@ class TakeWhile(Op):
             self.set_done()
             self._disconnect_from(self._source)
 
+    def _step(self, args):
+        if self._predicate(*args):
+            return args
+        # end in the unfused chain so that done events cascade as usual
+        self._fused_into._unfuse()
+        self.set_done()
+        self._disconnect_from(self._source)
+
+    _fused_on_source = on_source
+
 
 class DropWhile(Op):
     __slots__ = ('_predicate', '_drop')
 
+    _fusable = True
+
     def __init__(self, predicate=lambda x: not x, source=None):
         Op.__init__(self, source)
         self._predicate = predicate
@@ -75,6 +99,14 @@ class DropWhile(Op):
         if not self._drop:
             self.emit(*args)
 
+    def _step(self, args):
+        if self._drop:
+            self._drop = self._predicate(*args)
+        if not self._drop:
+            return args
+
+    _fused_on_source = on_source
+
 
 class TakeUntil(Op):
     __slots__ = ('_notifier',)
@@ -100,34 +132,54 @@ class TakeUntil(Op):
 
 
 class Changes(Op):
-    __slots__ = ('_prev',)
+    __slots__ = ('_prev', '_single')
 
     def __init__(self, source=None):
         Op.__init__(self, source)
         self._prev = NO_VALUE
+        self._single = False  # _prev holds a single unwrapped value
 
     def on_source(self, *args):
-        if args != self._prev:
-            self.emit(*args)
-        self._prev = args
+        if len(args) == 1:
+            # compare the bare value, by identity first
+            value = args[0]
+            prev = self._prev
+            self._prev = value
+            if self._single:
+                if value is prev or value == prev:
+                    return
+            else:
+                self._single = True
+        else:
+            if not self._single and args == self._prev:
+                return
+            self._prev = args
+            self._single = False
+        self.emit(*args)
 
 
 class Unique(Op):
-    __slots__ = ('_key', '_seen')
+    __slots__ = ('_key', '_seen', '_seen_add', '_seen_list')
 
     def __init__(self, key, source=None):
         Op.__init__(self, source)
         self._key = key
         self._seen = set()
+        self._seen_add = self._seen.add
+        self._seen_list = []  # unhashable groups, checked by equality
 
     def on_source(self, *args):
-        if self._key is None:
-            new = args not in self._seen
-        else:
-            new = self._key(*args) not in self._seen
-        self._seen.add(args)
-        if new:
-            self.emit(*args)
+        key = self._key
+        group = args if key is None else key(*args)
+        try:
+            if group in self._seen:
+                return
+            self._seen_add(group)
+        except TypeError:
+            if group in self._seen_list:
+                return
+            self._seen_list.append(group)
+        self.emit(*args)
 
 
 class Last(Op):
@@ -141,5 +193,6 @@ class Last(Op):
         self._last = args
 
     def on_source_done(self, source):
-        self.emit(*self._last)
+        if self._last is not NO_VALUE:
+            self.emit(*self._last)
         Op.on_source_done(self, source)
@@ -13,37 +13,43 @@ class Delay(Op):
         self._delay = delay
 
     def on_source(self, *args):
-        loop = get_event_loop()
-        loop.call_later(self._delay, self.emit, *args)
+        self._schedule(self.emit, *args)
 
-    def on_source_error(self, error):
-        loop = get_event_loop()
-        loop.call_later(self._delay, self.error_event.emit, error)
+    def on_source_error(self, source, error):
+        self._schedule(Op.on_source_error, self, source, error)
 
     def on_source_done(self, source):
         if self._source is not None:
             self._disconnect_from(self._source)
             self._source = None
+        self._schedule(self.set_done)
+
+    def _schedule(self, callback, *args):
         loop = get_event_loop()
-        loop.call_later(self._delay, self.set_done)
+        if self._delay:
+            loop.call_at(loop.time() + self._delay, callback, *args)
+        else:
+            # defer to the next loop iteration without a timer handle
+            loop.call_soon(callback, *args)
 
 
 class Timeout(Op):
-    __slots__ = ('_timeout', '_handle', '_last_time')
+    __slots__ = ('_timeout', '_handle', '_last_time', '_time', '_call_at')
 
     def __init__(self, timeout, source=None):
         Op.__init__(self, source)
         if source is not None and source.done():
             return
-        self._timeout = timeout
         loop = get_event_loop()
-        self._last_time = loop.time()
+        self._time = loop.time
+        self._call_at = loop.call_at
+        self._timeout = timeout
+        self._last_time = self._time()
         self._handle = None
         self._schedule()
 
     def on_source(self, *args):
-        loop = get_event_loop()
-        self._last_time = loop.time()
+        self._last_time = self._time()
 
     def on_source_done(self, source):
         self._handle.cancel()
@@ -51,13 +57,11 @@ class Timeout(Op):
         Op.on_source_done(self, source)
 
     def _schedule(self):
-        loop = get_event_loop()
-        self._handle = loop.call_at(
+        self._handle = self._call_at(
             self._last_time + self._timeout, self._on_timer)
 
     def _on_timer(self):
-        loop = get_event_loop()
-        if loop.time() - self._last_time > self._timeout:
+        if self._time() - self._last_time > self._timeout:
             self.emit()
             self.set_done()
         else:
@@ -65,7 +69,8 @@ class Timeout(Op):
 
 
 class Debounce(Op):
-    __slots__ = ('_interval', '_on_first', '_handle', '_last_time')
+    __slots__ = (
+        '_interval', '_on_first', '_handle', '_last_time', '_args')
 
     def __init__(self, interval, on_first=False, source=None):
         Op.__init__(self, source)
@@ -73,6 +78,7 @@ class Debounce(Op):
         self._on_first = on_first
         self._last_time = -float('inf')
         self._handle = None
+        self._args = NO_VALUE
 
     def on_source(self, *args):
         loop = get_event_loop()
@@ -83,13 +89,22 @@ class Debounce(Op):
             if delta >= self._interval:
                 self.emit(*args)
         else:
-            if self._handle:
-                self._handle.cancel()
-            self._handle = loop.call_at(
-                time + self._interval, self._delayed_emit, *args)
-
-    def _delayed_emit(self, *args):
+            # keep a single timer alive instead of cancelling and
+            # rescheduling it on every event
+            self._args = args
+            if self._handle is None:
+                self._handle = loop.call_at(
+                    time + self._interval, self._delayed_emit)
+
+    def _delayed_emit(self):
+        deadline = self._last_time + self._interval
+        loop = get_event_loop()
+        if deadline > loop.time():
+            self._handle = loop.call_at(deadline, self._delayed_emit)
+            return
         self._handle = None
+        args = self._args
+        self._args = NO_VALUE
         self.emit(*args)
         if self._source is None:
             self.set_done()
@@ -104,7 +119,7 @@ class Debounce(Op):
 class Throttle(Op):
     __slots__ = (
         'status_event', '_maximum', '_interval', '_cost_func',
-        '_q', '_time_q', '_cost_q', '_is_throttling')
+        '_q', '_emits', '_total_cost', '_is_throttling')
 
     def __init__(self, maximum, interval, cost_func=None, source=None):
         Op.__init__(self, source)
@@ -117,8 +132,8 @@ class Throttle(Op):
         self._interval = interval
         self._cost_func = cost_func
         self._q = deque()        # deque of (args, cost) tuples
-        self._time_q = deque()   # deque of previous emit times
-        self._cost_q = deque()   # deque of costs of previous emits
+        self._emits = deque()    # deque of (time, cost) of previous emits
+        self._total_cost = 0     # sum of the costs in _emits
         self._is_throttling = False
 
     def set_limit(self, maximum, interval):
@@ -146,35 +161,41 @@ class Throttle(Op):
         loop = get_event_loop()
         t = loop.time()
         q = self._q
-        times = self._time_q
-        costs = self._cost_q
+        emits = self._emits
 
-        # forget old emit times
-        while times and t - times[0] > self._interval:
-            times.popleft()
-            costs.popleft()
+        # forget old emits
+        while emits and t - emits[0][0] > self._interval:
+            _, cost = emits.popleft()
+            if cost is not None:
+                self._total_cost -= cost
+        if not emits:
+            self._total_cost = 0  # don't let rounding errors build up
 
         # emit values while not exceeding the limit
-        while q:
-            args, cost = q[0]
-            if self._cost_func:
-                cost = self._cost_func(*args)
-                total_cost = cost + sum(costs)
-            else:
-                cost = None
-                total_cost = 1 + len(costs)
-            if self._maximum and total_cost >= self._maximum:
-                break
-            args, cost = q.popleft()
-            times.append(t)
-            costs.append(cost)
-            self.emit(*args)
+        if self._cost_func is None:
+            # every emit has unit cost
+            while q:
+                if self._maximum and 1 + len(emits) >= self._maximum:
+                    break
+                args, _ = q.popleft()
+                emits.append((t, None))
+                self.emit(*args)
+        else:
+            while q:
+                args, cost = q[0]
+                if self._maximum and \
+                        cost + self._total_cost >= self._maximum:
+                    break
+                q.popleft()
+                emits.append((t, cost))
+                self._total_cost += cost
+                self.emit(*args)
 
         # update status and schedule new emits
         if q:
             if not self._is_throttling:
                 self.status_event.emit(True)
-            loop.call_at(times[0] + self._interval, self._try_emit)
+            loop.call_at(emits[0][0] + self._interval, self._try_emit)
         elif self._is_throttling:
             self.status_event.emit(False)
         self._is_throttling = bool(q)
@@ -196,6 +217,8 @@ class Sample(Op):
             self.on_source_done)
 
     def on_source(self, *args):
+        # _value is the slot of Event that starts out as NO_VALUE
+        # and that emit itself also sets to the emitted args
         self._value = args
 
     def _on_timer(self, *args):
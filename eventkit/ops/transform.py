@@ -1,6 +1,8 @@
 import asyncio
 import copy
+import operator
 import time
+import types
 from collections import deque
 
 from .combine import Chain, Concat, Merge, Switch
@@ -11,6 +13,8 @@ from ..util import NO_VALUE, get_event_loop
 class Constant(Op):
     __slots__ = ('_constant',)
 
+    _fusable = True
+
     def __init__(self, constant, source=None):
         Op.__init__(self, source)
         self._constant = constant
@@ -18,6 +22,11 @@ class Constant(Op):
     def on_source(self, *args):
         self.emit(self._constant)
 
+    def _step(self, args):
+        return (self._constant,)
+
+    _fused_on_source = on_source
+
 
 class Iterate(Op):
     __slots__ = ('_it',)
@@ -36,27 +45,27 @@ class Iterate(Op):
 
 
 class Enumerate(Op):
-    __slots__ = ('_step', '_i')
+    __slots__ = ('_increment', '_i')
 
     def __init__(self, start=0, step=1, source=None):
         Op.__init__(self, source)
         self._i = start
-        self._step = step
+        self._increment = step
 
-    def on_source(self, *args):
-        self.emit(
-            self._i,
-            args[0] if len(args) == 1 else args if args else NO_VALUE)
-        self._i += self._step
+    def on_source(self, value=NO_VALUE, *rest):
+        if rest:
+            value = (value,) + rest
+        self.emit(self._i, value)
+        self._i += self._increment
 
 
 class Timestamp(Op):
     __slots__ = ()
 
-    def on_source(self, *args):
-        self.emit(
-            time.time(),
-            args[0] if len(args) == 1 else args if args else NO_VALUE)
+    def on_source(self, value=NO_VALUE, *rest):
+        if rest:
+            value = (value,) + rest
+        self.emit(time.time(), value)
 
 
 class Partial(Op):
@@ -96,11 +105,14 @@ class Pack(Op):
 
 
 class Pluck(Op):
-    __slots__ = ('_selections',)
+    __slots__ = ('_getters',)
+
+    _fusable = True
 
     def __init__(self, *selections, source=None):
         Op.__init__(self, source)
-        self._selections = []  # list of [arg-index, *sub-attributes]
+        # one getter per selection of [arg-index, *sub-attributes]
+        self._getters = []
         for sel in selections:
             if type(sel) is int:
                 s = [sel]
@@ -112,67 +124,151 @@ class Pluck(Op):
                     s[0] = 0
                 else:
                     s.insert(0, 0)
-            self._selections.append(s)
+            self._getters.append(_getter(*s))
 
     def on_source(self, *args):
-        values = []
-        for s in self._selections:
-            try:
-                value = args[s[0]]
-                for attr in s[1:]:
-                    value = getattr(value, attr)
-            except Exception:
-                value = NO_VALUE
-            values.append(value)
-        self.emit(*values)
+        self.emit(*self._step(args))
+
+    def _step(self, args):
+        try:
+            return tuple([get(args) for get in self._getters])
+        except Exception:
+            # a selection is missing: pluck one by one
+            values = []
+            for get in self._getters:
+                try:
+                    value = get(args)
+                except Exception:
+                    value = NO_VALUE
+                values.append(value)
+            return tuple(values)
+
+    _fused_on_source = on_source
+
+
+def _getter(index, *attrs):
+    """
+    Create a getter for the given argument index and sub-attributes.
+    """
+    item = operator.itemgetter(index)
+    if not attrs:
+        return item
+    attr = operator.attrgetter('.'.join(attrs))
+    return lambda args: attr(item(args))
 
 
 class Previous(Op):
-    __slots__ = ('_count', '_q')
+    __slots__ = ('_count', '_q', '_prev')
 
     def __init__(self, count=1, source=None):
         Op.__init__(self, source)
         self._count = count
-        self._q = deque()
+        # a count of one needs only the previous args, not a queue
+        self._q = deque() if count != 1 else None
+        self._prev = NO_VALUE
 
     def on_source(self, *args):
-        self._q.append(args)
-        if len(self._q) > self._count:
-            self.emit(*self._q.popleft())
+        q = self._q
+        if q is None:
+            prev = self._prev
+            self._prev = args
+            if prev is not NO_VALUE:
+                self.emit(*prev)
+        else:
+            q.append(args)
+            if len(q) > self._count:
+                self.emit(*q.popleft())
+
+
+# types whose values never need copying
+_ATOMIC = frozenset((
+    type(None), bool, int, float, complex, str, bytes, range))
+
+# types that copy.copy returns unchanged
+_SHALLOW_IMMUTABLE = _ATOMIC | {tuple, frozenset}
+
+# common result types that are known not to be awaitable
+_NOT_AWAITABLE = _SHALLOW_IMMUTABLE | {list, dict, set}
+
+
+# exact types with a C-level shallow copy method
+_COPIERS = {
+    list: list.copy, dict: dict.copy, set: set.copy,
+    bytearray: bytearray.copy}
+
+
+def _is_immutable(a):
+    t = type(a)
+    if t in _ATOMIC:
+        return True
+    return (t is tuple or t is frozenset) and all(
+        type(x) in _ATOMIC for x in a)
+
+
+def _is_flat(a):
+    """
+    See if a is a list, set or dict of atomic values only, for which
+    a shallow copy is as good as a deep copy.
+    """
+    t = type(a)
+    if t is list or t is set:
+        return all(type(x) in _ATOMIC for x in a)
+    if t is dict:
+        return all(type(x) in _ATOMIC for x in a) and all(
+            type(x) in _ATOMIC for x in a.values())
+    return False
 
 
 class Copy(Op):
     __slots__ = ()
 
     def on_source(self, *args):
-        self.emit(*(copy.copy(a) for a in args))
+        self.emit(*(
+            a if type(a) in _SHALLOW_IMMUTABLE
+            else _COPIERS.get(type(a), copy.copy)(a)
+            for a in args))
 
 
 class Deepcopy(Op):
     __slots__ = ()
 
     def on_source(self, *args):
-        self.emit(*copy.deepcopy(args))
+        if all(_is_immutable(a) for a in args):
+            self.emit(*args)
+        elif len(args) == 1 and _is_flat(args[0]):
+            # a single arg can't share references with other args
+            a = args[0]
+            self.emit(_COPIERS[type(a)](a))
+        else:
+            self.emit(*copy.deepcopy(args))
 
 
 class Chunk(Op):
-    __slots__ = ('_size', '_list')
+    __slots__ = ('_size', '_buf', '_i')
 
     def __init__(self, size, source=None):
         Op.__init__(self, source)
         self._size = size
-        self._list = []
-
-    def on_source(self, *args):
-        self._list.append(
-            args[0] if len(args) == 1 else args if args else NO_VALUE)
-        if len(self._list) == self._size:
-            self.emit(self._list)
-            self._list = []
+        # reused buffer, every chunk is emitted as a copy of it
+        self._buf = [None] * size
+        self._i = 0
+
+    def on_source(self, value=NO_VALUE, *rest):
+        if rest:
+            value = (value,) + rest
+        i = self._i
+        self._buf[i] = value
+        i += 1
+        if i == self._size:
+            self._i = 0
+            self.emit(self._buf[:])
+        else:
+            self._i = i
 
     def on_source_done(self, source):
-        if self._list:
-            self.emit(self._list)
+        if self._i:
+            self.emit(self._buf[:self._i])
+            self._i = 0
         Op.on_source_done(self, self._source)
 
 
@@ -189,9 +285,10 @@ class ChunkWith(Op):
             self.on_source_error,
             self.on_source_done)
 
-    def on_source(self, *args):
-        self._list.append(
-            args[0] if len(args) == 1 else args if args else NO_VALUE)
+    def on_source(self, value=NO_VALUE, *rest):
+        if rest:
+            value = (value,) + rest
+        self._list.append(value)
 
     def _on_timer(self, *args):
         if self._list or self._emit_empty:
@@ -215,6 +312,8 @@ class Map(Op):
     __slots__ = (
         '_func', '_timeout', '_ordered', '_task_limit', '_coro_q', '_tasks')
 
+    _fusable = True
+
     def __init__(
             self, func, timeout=0, ordered=True, task_limit=None, source=None):
         Op.__init__(self, source)
@@ -229,7 +328,7 @@ class Map(Op):
 
     def on_source(self, *args):
         obj = self._func(*args)
-        if hasattr(obj, '__await__'):
+        if type(obj) not in _NOT_AWAITABLE and hasattr(obj, '__await__'):
             # function returns an awaitable
             if not self._task_limit or len(self._tasks) < self._task_limit:
                 # schedule right away
@@ -252,7 +351,11 @@ class Map(Op):
         if self._timeout:
             coro = asyncio.wait_for(coro, self._timeout)
         loop = get_event_loop()
-        task = asyncio.ensure_future(coro, loop=loop)
+        if type(coro) is types.CoroutineType:
+            task = loop.create_task(coro)
+        else:
+            # a future or other awaitable
+            task = asyncio.ensure_future(coro, loop=loop)
         task.add_done_callback(self._on_task_done)
         self._tasks.append(task)
 
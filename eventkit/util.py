@@ -2,11 +2,16 @@ import asyncio
 import datetime as dt
 from typing import AsyncIterator
 
+_get_running_loop = asyncio._get_running_loop
+
 
 class _NoValue:
     def __bool__(self):
         return False
 
+    def __len__(self):
+        return 0
+
     def __repr__(self):
         return '<NoValue>'
 
@@ -18,7 +23,11 @@ NO_VALUE = _NoValue()
 
 def get_event_loop():
     """Get asyncio event loop, running or not."""
-    return asyncio.get_event_loop_policy().get_event_loop()
+    # the running loop is found without going through the policy
+    loop = _get_running_loop()
+    if loop is None:
+        loop = asyncio.get_event_loop_policy().get_event_loop()
+    return loop
 
 
 main_event_loop = get_event_loop()
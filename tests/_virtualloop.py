@@ -0,0 +1,64 @@
+import asyncio
+import selectors
+
+_TICK = 1e-9  # virtual time that passes with each clock reading
+
+_saved_loops = []
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """
+    Selector that, instead of blocking until the next scheduled
+    callback is due, advances the virtual clock to that moment.
+    """
+
+    def __init__(self):
+        selectors.DefaultSelector.__init__(self)
+        self.now = 0.0
+
+    def select(self, timeout=None):
+        if timeout is None:
+            # nothing is scheduled, wait for I/O such as threadsafe calls
+            return selectors.DefaultSelector.select(self, None)
+        events = selectors.DefaultSelector.select(self, 0)
+        if not events:
+            self.now += timeout
+        return events
+
+
+class VirtualLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop with a virtual clock that jumps ahead to the next
+    scheduled callback, so that timed tests don't sleep in real time.
+    """
+
+    def __init__(self):
+        self._virtual_selector = _VirtualSelector()
+        asyncio.SelectorEventLoop.__init__(self, self._virtual_selector)
+
+    def time(self):
+        # let every reading take a tick, as with a real clock, so that
+        # timers scheduled one after the other never share the same time
+        # (the loop doesn't keep timers with equal times in FIFO order)
+        selector = self._virtual_selector
+        selector.now += _TICK
+        return selector.now
+
+
+def install():
+    """
+    Make a new virtual loop the current event loop.
+    """
+    policy = asyncio.get_event_loop_policy()
+    _saved_loops.append(policy.get_event_loop())
+    policy.set_event_loop(VirtualLoop())
+
+
+def uninstall():
+    """
+    Close the virtual loop and restore the previous event loop.
+    """
+    policy = asyncio.get_event_loop_policy()
+    loop = policy.get_event_loop()
+    policy.set_event_loop(_saved_loops.pop())
+    loop.close()
@@ -1,6 +1,7 @@
 import unittest
 
 from eventkit import Event
+import eventkit as ev
 
 array = list(range(10))
 
@@ -27,13 +28,20 @@ class AggregateTest(unittest.TestCase):
 
     def test_any(self):
         event = Event.sequence(array).any()
-        self.assertEqual(event.run(), [
-            False, True, True, True, True, True, True, True, True, True])
+        self.assertEqual(event.run(), [False, True])
 
     def test_all(self):
         x = [True] * 10 + [False] * 10
         event = Event.sequence(x).all()
-        self.assertEqual(event.run(), x)
+        self.assertEqual(event.run(), [True] * 10 + [False])
+
+    def test_ema(self):
+        event = Event.sequence([1, 3, 3, 7]).ema(weight=0.5)
+        self.assertEqual(event.run(), [1, 2, 2.5, 4.75])
+        event = ev.Ema(3, source=Event.sequence([1, 3, 3, 7]).map(
+            lambda x: (x, -x)).star())
+        self.assertEqual(event.run(), [
+            (1, -1), (2, -2), (2.5, -2.5), (4.75, -4.75)])
 
     def test_pairwaise(self):
         event = Event.sequence(array).pairwise()
@@ -48,6 +56,95 @@ class AggregateTest(unittest.TestCase):
         event = Event.sequence(array, 0.01).chunkwith(timer)
         self.assertEqual(event.run(), [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]])
 
+    def test_deque(self):
+        event = Event.sequence(array).deque(5).last()
+        self.assertEqual(list(event.run()[0]), array[-5:])
+        event = Event.sequence(array).deque().last()
+        self.assertEqual(list(event.run()[0]), array)
+
     def test_array(self):
         event = Event.sequence(array).array(5).last()
         self.assertEqual(list(event.run()[0]), array[-5:])
+
+    def test_array_unbounded(self):
+        values = list(range(40)) + [0.5]
+        result = Event.sequence(values).array().run()
+        self.assertEqual(
+            [list(a) for a in result],
+            [values[:i + 1] for i in range(len(values))])
+        self.assertEqual(result[-1].dtype.kind, 'f')
+
+    def test_array_ragged(self):
+        values = [[1, 2], [3], [4, 5, 6], [7]]
+        source = Event()
+        event = source.array(3)
+        for v in values:
+            source.emit(v)
+        buf = event._buf
+        source.emit([8, 9])
+        # the object buffer is reused once the values are ragged
+        self.assertIs(event._buf, buf)
+        window = event.value()
+        self.assertTrue(all(type(row) is type(window[0]) for row in window))
+        self.assertEqual(
+            [list(row) for row in window], [[4, 5, 6], [7], [8, 9]])
+
+    def test_array_std(self):
+        import statistics
+        result = Event.sequence(array).array(4).std().run()
+        self.assertNotEqual(result[0], result[0])
+        for i in range(1, len(array)):
+            self.assertAlmostEqual(
+                result[i], statistics.stdev(array[max(0, i - 3):i + 1]))
+
+    def test_array_any_all(self):
+        x = [0, 0, 1, 1, 1, 1, 0]
+        event = Event.sequence(x).array(3)
+        self.assertEqual(event.any().run(), [
+            False, False, True, True, True, True, True])
+        event = Event.sequence(x).array(3)
+        self.assertEqual(event.all().run(), [
+            False, False, False, False, True, True, False])
+
+    def test_rolling_sum_mean(self):
+        event = ev.RollingSum(3, Event.sequence(array))
+        self.assertEqual(event.run(), [
+            0, 1, 3, 6, 9, 12, 15, 18, 21, 24])
+        event = ev.RollingMean(2, Event.sequence(array))
+        self.assertEqual(event.run(), [
+            0, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5])
+
+    def test_rolling_all(self):
+        import itertools
+        import statistics
+        # count 0 uses all values so far
+        x = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+        event = Event.sequence(x).rolling_sum(0)
+        self.assertEqual(event.run(), list(itertools.accumulate(x)))
+        self.assertIsNone(event._q)
+        event = Event.sequence(x).rolling_mean(0)
+        self.assertEqual(event.run(), [
+            s / (i + 1) for i, s in enumerate(itertools.accumulate(x))])
+        result = Event.sequence(x).rolling_std(0).run()
+        for i in range(1, len(x)):
+            self.assertAlmostEqual(result[i], statistics.stdev(x[:i + 1]))
+        event = Event.sequence(x).rolling_min(0)
+        self.assertEqual(event.run(), list(itertools.accumulate(x, min)))
+        event = Event.sequence(x).rolling_max(0)
+        self.assertEqual(event.run(), list(itertools.accumulate(x, max)))
+
+    def test_rolling_std(self):
+        import statistics
+        x = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+        result = ev.RollingStd(4, Event.sequence(x)).run()
+        self.assertNotEqual(result[0], result[0])
+        for i in range(1, len(x)):
+            self.assertAlmostEqual(
+                result[i], statistics.stdev(x[max(0, i - 3):i + 1]))
+
+    def test_rolling_min_max(self):
+        x = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+        event = ev.RollingMin(3, Event.sequence(x))
+        self.assertEqual(event.run(), [3, 1, 1, 1, 1, 1, 2, 2, 2, 3])
+        event = ev.RollingMax(3, Event.sequence(x))
+        self.assertEqual(event.run(), [3, 3, 4, 4, 5, 9, 9, 9, 6, 6])
@@ -2,11 +2,21 @@ import unittest
 
 from eventkit import Event
 
+from . import _virtualloop
+
 array1 = list(range(10))
 array2 = list(range(100, 110))
 array3 = list(range(200, 210))
 
 
+def setUpModule():
+    _virtualloop.install()
+
+
+def tearDownModule():
+    _virtualloop.uninstall()
+
+
 class CombineTest(unittest.TestCase):
 
     def test_merge(self):
@@ -53,3 +63,9 @@ class CombineTest(unittest.TestCase):
         event = e1.ziplatest(e2)
         self.assertEqual(
             event.run(), [(0, Event.NO_VALUE), (0, 2), (1, 2), (1, 3)])
+
+    def test_ziplatest_not_partial(self):
+        e1 = Event.sequence([0, 1], interval=0.01)
+        e2 = Event.sequence([2, 3], interval=0.01).delay(0.001)
+        event = e1.ziplatest(e2, partial=False)
+        self.assertEqual(event.run(), [(0, 2), (1, 2), (1, 3)])
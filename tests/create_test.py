@@ -29,3 +29,17 @@ class CreateTest(unittest.TestCase):
         s = '   a b c   d e f'
         event = Event.marble(s, interval=0.001)
         self.assertEqual(event.run(), [c for c in 'abcdef'])
+        event = Event.marble('a_b-c|de', interval=0.001)
+        self.assertEqual(event.run(), ['a', 'b', 'c'])
+
+    def test_sequence_times(self):
+        event = Event.sequence(array1[:3], times=[0.02, 0.01, 0.03])
+        self.assertEqual(event.timestamp().pluck(1).run(), array1[:3])
+
+    def test_repeat(self):
+        event = Event.repeat('x', 3, interval=0.001)
+        self.assertEqual(event.run(), ['x', 'x', 'x'])
+
+    def test_timer(self):
+        event = Event.timer(0.002, count=5)
+        self.assertEqual(event.run(), [0.002 * i for i in range(1, 6)])
@@ -9,6 +9,8 @@ run = loop.run_until_complete
 
 
 class Object:
+    # __weakref__ keeps the weakly referenced slots of test_keep_ref
+    __slots__ = ('value', '__weakref__')
 
     def __init__(self):
         self.value = 0
@@ -94,6 +96,37 @@ class EventTest(unittest.TestCase):
         self.assertNotIn(f2, event)
         self.assertEqual(len(event), 0)
 
+    def test_disconnect_during_emit(self):
+        values = []
+
+        def l1(x):
+            values.append(('l1', x))
+            event.disconnect(l2)
+
+        def l2(x):
+            values.append(('l2', x))
+
+        event = Event('test')
+        event += l1
+        event += l2
+        event.emit(1)
+        event.emit(2)
+        self.assertEqual(values, [('l1', 1), ('l1', 2)])
+
+    def test_connect_many(self):
+        obj1 = Object()
+        obj2 = Object()
+        mapped = ev.Map(lambda x, y: x * y)
+        event = Event('test')
+        event.connect_many([obj1.method, obj2, mapped])
+        self.assertEqual(len(event), 3)
+        event.emit(9, 4)
+        self.assertEqual(obj1.value, 5)
+        self.assertEqual(obj2.value, 5)
+        self.assertEqual(mapped.value(), 36)
+        self.assertIn(obj1.method, event)
+        self.assertIn(obj2, event)
+
     def test_cmethod(self):
         import math
         event = Event('test')
@@ -116,6 +149,18 @@ class EventTest(unittest.TestCase):
         event -= obj.method
         self.assertNotIn(obj.method, event)
 
+    def test_op_without_cycle(self):
+        import gc
+        import weakref
+        gc.disable()
+        try:
+            op = ev.Map(abs)
+            wr = weakref.ref(op)
+            del op
+            self.assertIsNone(wr())
+        finally:
+            gc.enable()
+
     def test_coro_func(self):
         async def coro(d):
             result.append(d)
@@ -136,6 +181,42 @@ class EventTest(unittest.TestCase):
         run(asyncio.sleep(0))
         self.assertEqual(result, [])
 
+    def test_emit_threadsafe(self):
+        import threading
+
+        def produce():
+            for i in range(10):
+                event.emit_threadsafe(i)
+            event.emit_threadsafe(1, 2)
+
+        result = []
+        event = Event('test')
+        event += lambda *args: result.append(args)
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join()
+        run(asyncio.sleep(0))
+        self.assertEqual(result, [(i,) for i in range(10)] + [(1, 2)])
+
+    def test_emit_threadsafe_order(self):
+        import threading
+
+        def produce():
+            a.emit_threadsafe(1)
+            b.emit_threadsafe(1)
+            a.emit_threadsafe(2)
+
+        result = []
+        a = Event('a')
+        b = Event('b')
+        a += lambda x: result.append(('a', x))
+        b += lambda x: result.append(('b', x))
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join()
+        run(asyncio.sleep(0))
+        self.assertEqual(result, [('a', 1), ('b', 1), ('a', 2)])
+
     def test_aiter(self):
         async def coro():
             return [v async for v in event]
@@ -161,6 +242,27 @@ class EventTest(unittest.TestCase):
             ev1.emit(i)
         self.assertEqual(result, list(range(10, 20)))
 
+    def test_errors(self):
+        src = Event('src')
+        errors = []
+        src.errors().connect(lambda source, e: errors.append(e))
+        ended = src.end_on_error()
+        ended.error_event += lambda source, e: None
+        error = ValueError('test')
+        src.error_event.emit(src, error)
+        self.assertEqual(errors, [error])
+        self.assertTrue(ended.done())
+        # without a source there is nothing to listen to
+        errors = ev.Errors()
+        self.assertIsNone(errors._source)
+        self.assertFalse(errors.done())
+
+    def test_array_exports(self):
+        for name in ev._ARRAY_NAMES:
+            self.assertEqual(getattr(ev, name).__name__, name)
+        with self.assertRaises(AttributeError):
+            ev.Nope
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
 from eventkit import Event
+import eventkit as ev
 
 array = list(range(10))
 
@@ -11,6 +12,92 @@ class SelectTest(unittest.TestCase):
         event = Event.sequence(array).filter(lambda x: x % 2)
         self.assertEqual(event.run(), [x for x in array if x % 2])
 
+    def test_fused_chain(self):
+        event = Event.sequence(array) \
+            .filter(lambda x: x % 2) \
+            .dropwhile(lambda x: x < 3) \
+            .takewhile(lambda x: x < 9) \
+            .map(lambda x: x * 10)
+        self.assertEqual(event.run(), [30, 50, 70])
+
+    def test_fused_chain_unfuses(self):
+        source = Event()
+        filtered = source.filter(lambda x: x % 2)
+        mapped = filtered.map(lambda x: x * 10)
+        self.assertEqual(len(source._slots), 1)
+        values = []
+        mapped += values.append
+        source.emit(1)
+        source.emit(2)
+        # a listener of its own restores the regular chain
+        filtered_values = []
+        filtered += filtered_values.append
+        source.emit(3)
+        source.emit(4)
+        self.assertEqual(values, [10, 30])
+        self.assertEqual(filtered_values, [3])
+        source.set_done()
+        self.assertTrue(filtered.done())
+        self.assertTrue(mapped.done())
+
+    def test_fused_chain_state(self):
+        source = Event()
+        filtered = source.filter(lambda x: x % 2)
+        mapped = filtered.map(lambda x: x * 10)
+        self.assertIs(filtered._fused_into, mapped)
+        source.emit(3)
+        source.emit(4)
+        self.assertEqual(filtered.value(), 3)
+        self.assertEqual(mapped.value(), 30)
+        # an error from upstream reaches the error event of the filter
+        errors = []
+        filtered.error_event += lambda source, error: errors.append(error)
+        error = ValueError('test')
+        source.error_event.emit(source, error)
+        self.assertEqual(errors, [error])
+        self.assertIsNone(filtered._fused_into)
+
+    def test_fused_chain_direct_emit(self):
+        source = Event()
+        filtered = source.filter(lambda x: x % 2)
+        dropped = filtered.dropwhile(lambda x: x < 3)
+        mapped = dropped.map(lambda x: x * 10)
+        self.assertIs(filtered._fused_into, mapped)
+        self.assertEqual(len(filtered), 1)
+        values = []
+        mapped += values.append
+        source.emit(3)
+        # values emitted by the absorbed ops themselves still arrive
+        filtered.emit(4)
+        filtered.on_source(5)
+        dropped.emit(6)
+        self.assertEqual(values, [30, 40, 50, 60])
+        self.assertIs(filtered._fused_into, mapped)
+
+    def test_fused_chain_subclass(self):
+        calls = []
+
+        class LoggingFilter(ev.Filter):
+            __slots__ = ()
+
+            def on_source(self, *args):
+                calls.append(args)
+                ev.Filter.on_source(self, *args)
+
+        class Stepping(ev.Op):
+            __slots__ = ('_step',)
+
+            def __init__(self, source=None):
+                ev.Op.__init__(self, source)
+                self._step = 1
+
+        event = LoggingFilter(lambda x: x % 2, Event.sequence(array)) \
+            .map(lambda x: x * 10)
+        self.assertEqual(event.run(), [10, 30, 50, 70, 90])
+        self.assertEqual(calls, [(x,) for x in array])
+        event = Stepping(Event.sequence(array)).map(lambda x: x * 10)
+        self.assertEqual(event.run(), [x * 10 for x in array])
+
     def test_skip(self):
         event = Event.sequence(array).skip(5)
         self.assertEqual(event.run(), array[5:])
@@ -37,6 +124,20 @@ class SelectTest(unittest.TestCase):
         event = Event.sequence(array).unique()
         self.assertEqual(event.run(), [1, 2, 3, 4])
 
+    def test_unique_unhashable(self):
+        array = [[1], [1], [2], [1, 2], [2]]
+        event = Event.sequence(array).unique()
+        self.assertEqual(event.run(), [[1], [2], [1, 2]])
+        event = Event.sequence(array).unique(key=len)
+        self.assertEqual(event.run(), [[1], [1, 2]])
+
     def test_last(self):
         event = Event.sequence(array).last()
         self.assertEqual(event.run(), [9])
+        source = Event()
+        event = source.last()
+        values = []
+        event += values.append
+        source.set_done()
+        self.assertEqual(values, [])
+        self.assertTrue(event.done())
@@ -1,28 +1,94 @@
+import asyncio
 import unittest
-import time
 
 from eventkit import Event
 
+from . import _virtualloop
+
 array1 = list(range(10))
 array2 = list(range(100, 110))
 array3 = list(range(200, 210))
 
 
+def setUpModule():
+    _virtualloop.install()
+
+
+def tearDownModule():
+    _virtualloop.uninstall()
+
+
+def loop_time(*args):
+    return asyncio.get_event_loop_policy().get_event_loop().time()
+
+
 class TimingTest(unittest.TestCase):
 
     def test_delay(self):
         delay = 0.01
         src = Event.sequence(array1, interval=0.01)
-        e1 = src.timestamp().pluck(0)
-        e2 = src.delay(delay).timestamp().pluck(0)
+        e1 = src.map(loop_time)
+        e2 = src.delay(delay).map(loop_time)
         r = e1.zip(e2).map(lambda a, b: b - a).mean().run()
-        self.assertLess(abs(r[-1]), delay + 0.002)
+        self.assertAlmostEqual(r[-1], delay, places=6)
+
+    def test_delay_zero(self):
+        values = []
+        src = Event('src')
+        event = src.delay(0)
+        event += values.append
+        src.emit(1)
+        self.assertEqual(values, [])
+        event = Event.sequence(array1).delay(0)
+        self.assertEqual(event.run(), array1)
+
+    def test_delay_error(self):
+        errors = []
+        src = Event('src')
+        event = src.delay(0.001)
+        event.error_event += lambda source, error: errors.append(error)
+        error = ValueError('test')
+        src.error_event.emit(src, error)
+        self.assertEqual(errors, [])
+        src.set_done()
+        with self.assertRaises(ValueError):
+            event.run()
+        self.assertEqual(errors, [error])
+
+    def test_built_before_loop(self):
+        # ops that are built before the loop that runs them
+        src = Event('src')
+        delayed = []
+        src.delay(0.001).connect(delayed.append)
+        debounced = []
+        src.debounce(0.001).connect(debounced.append)
+        throttled = []
+        src.throttle(2, 0.001).connect(throttled.append)
+
+        async def main():
+            for i in range(3):
+                src.emit(i)
+            await asyncio.sleep(0.05)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.close()
+        self.assertEqual(delayed, [0, 1, 2])
+        self.assertEqual(debounced, [2])
+        self.assertEqual(throttled, [0, 1, 2])
 
     def test_sample(self):
         timer = Event.timer(0.021, 4)
         event = Event.range(10, interval=0.01).sample(timer)
         self.assertEqual(event.run(), [2, 4, 6, 8])
 
+    def test_sample_before_source(self):
+        timer = Event.timer(0.01, 5)
+        event = Event.sequence([1, 2], times=[0.025, 0.035]).sample(timer)
+        self.assertEqual(event.run(), [1])
+
     def test_timeout(self):
         timer = Event.timer(10, count=1)
         event = timer.timeout(0.01)
@@ -41,11 +107,27 @@ class TimingTest(unittest.TestCase):
         self.assertEqual(event.run(), [100] * 10)
 
     def test_throttle(self):
-        t0 = time.time()
-        a = list(range(500))
+        t0 = loop_time()
+        a = list(range(50))
+        costs = []
+
+        def cost_func(i):
+            costs.append(i)
+            return 10
+
         event = Event.sequence(a) \
-            .throttle(1000, 0.1, cost_func=lambda i: 10)
+            .throttle(100, 0.1, cost_func=cost_func)
         result = event.run()
         self.assertEqual(result, a)
-        dt = time.time() - t0
+        self.assertEqual(costs, a)
+        dt = loop_time() - t0
         self.assertLess(abs(dt - 0.5), 0.05)
+
+    def test_throttle_count(self):
+        t0 = loop_time()
+        a = list(range(50))
+        event = Event.sequence(a).throttle(11, 0.02)
+        result = event.run()
+        self.assertEqual(result, a)
+        dt = loop_time() - t0
+        self.assertLess(abs(dt - 0.1), 0.02)
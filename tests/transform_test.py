@@ -1,16 +1,19 @@
 import unittest
 import asyncio
+import statistics
 from collections import namedtuple
 
-import numpy as np
-
 from eventkit import Event
 
-loop = asyncio.get_event_loop_policy().get_event_loop()
-loop.set_debug(True)
-
 array = list(range(20))
 
+Person = namedtuple('Person', 'name address')
+Address = namedtuple('Address', 'city street number zipcode')
+people = [
+    Person('Max', Address('Delft', 'Levelstreet', '3', '2333AS')),
+    Person('Elena', Address('Leiden', 'Punt', '122', '2412DE')),
+    Person('Fem', Address('Rotterdam', 'Burgundy', '12', '3001RT'))]
+
 
 class TransformTest(unittest.TestCase):
 
@@ -21,6 +24,8 @@ class TransformTest(unittest.TestCase):
     def test_previous(self):
         event = Event.sequence(array).previous(2)
         self.assertEqual(event.run(), array[:-2])
+        event = Event.sequence(array).previous()
+        self.assertEqual(event.run(), array[:-1])
 
     def test_iterate(self):
         event = Event.sequence(array).iterate([5, 4, 3, 2, 1])
@@ -35,12 +40,16 @@ class TransformTest(unittest.TestCase):
         s = 'abcdefghij'
         event = Event.sequence(s).enumerate()
         self.assertEqual(event.run(), list(enumerate(s)))
+        event = Event.sequence(s).enumerate(step=2).filter(
+            lambda i, c: c in 'aeiou')
+        self.assertEqual(event.run(), [(0, 'a'), (8, 'e'), (16, 'i')])
 
     def test_timestamp(self):
         interval = 0.002
         event = Event.sequence(array, interval=interval).timestamp()
         times = event.pluck(0).run()
-        std = np.std(np.diff(times) - interval)
+        std = statistics.pstdev(
+            b - a - interval for a, b in zip(times, times[1:]))
         self.assertLess(std, interval)
 
     def test_partial(self):
@@ -64,19 +73,42 @@ class TransformTest(unittest.TestCase):
         self.assertEqual(event.run(), [(i,) for i in array])
 
     def test_pluck(self):
-        Person = namedtuple('Person', 'name address')
-        Address = namedtuple('Address', 'city street number zipcode')
-        data = [
-            Person('Max', Address('Delft', 'Levelstreet', '3', '2333AS')),
-            Person('Elena', Address('Leiden', 'Punt', '122', '2412DE')),
-            Person('Fem', Address('Rotterdam', 'Burgundy', '12', '3001RT'))]
-
         def event():
-            return Event.sequence(data)
+            return Event.sequence(people)
 
         self.assertEqual(
             event().pluck('0.name', '.address.street').run(),
-            [(d.name, d.address.street) for d in data])
+            [(p.name, p.address.street) for p in people])
+        self.assertEqual(
+            event().pluck('name', '.address.floor', 2).run(),
+            [(p.name, Event.NO_VALUE, Event.NO_VALUE) for p in people])
+
+    def test_chunk(self):
+        event = Event.sequence(array).chunk(6)
+        self.assertEqual(
+            event.run(), [array[i:i + 6] for i in range(0, len(array), 6)])
+
+    def test_copy(self):
+        values = [1, 'a', (1, 2), [3, [4]]]
+        result = Event.sequence(values).copy().run()
+        self.assertEqual(result, values)
+        self.assertIs(result[2], values[2])
+        self.assertIsNot(result[3], values[3])
+        self.assertIs(result[3][1], values[3][1])
+
+    def test_deepcopy(self):
+        values = [1, 'a', (1, 2), ([3],), [3, [4]]]
+        result = Event.sequence(values).deepcopy().run()
+        self.assertEqual(result, values)
+        self.assertIs(result[2], values[2])
+        self.assertIsNot(result[3][0], values[3][0])
+        self.assertIsNot(result[4][1], values[4][1])
+
+        values = [[1, 2], {'a': 1}, {3}]
+        result = Event.sequence(values).deepcopy().run()
+        self.assertEqual(result, values)
+        for r, v in zip(result, values):
+            self.assertIsNot(r, v)
 
     def test_sync_map(self):
         event = Event.sequence(array).map(lambda x: x * x)
@@ -91,7 +123,8 @@ class TransformTest(unittest.TestCase):
 
     def test_async_map(self):
         async def coro(x):
-            await asyncio.sleep(0.1)
+            # later values finish first, to check that order is kept
+            await asyncio.sleep(0.0005 * (len(array) - x))
             return x * x
 
         event = Event.sequence(array).map(coro)
@@ -101,10 +134,10 @@ class TransformTest(unittest.TestCase):
         class A():
 
             def __init__(self):
-                self.t = 0.1
+                self.t = 0.01
 
             async def coro(self, x):
-                self.t -= 0.01
+                self.t -= 0.001
                 await asyncio.sleep(self.t)
                 return x * x
 
@@ -114,6 +147,27 @@ class TransformTest(unittest.TestCase):
         expected = set(i * i for i in reversed(range(10)))
         self.assertEqual(result, expected)
 
+    def test_async_map_built_before_loop(self):
+        async def coro(x):
+            await asyncio.sleep(0)
+            return x * 2
+
+        src = Event('src')
+        values = []
+        src.map(coro).connect(values.append)
+
+        async def main():
+            src.emit(1)
+            await asyncio.sleep(0.01)
+
+        # the op is built before the loop that runs it
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.close()
+        self.assertEqual(values, [2])
+
     def test_mergemap(self):
         marbles = [
             'A   B    C    D',